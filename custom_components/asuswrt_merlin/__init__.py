@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
 from .const import DOMAIN
@@ -25,16 +26,37 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = AsusWrtMerlinDataUpdateCoordinator(hass, entry)
 
     try:
-        # Load persisted device last-seen timestamps before first refresh
-        await coordinator.async_load_persisted_last_seen()
-        await coordinator.async_config_entry_first_refresh()
+        # Load persisted data before the first refresh: its prune removes
+        # trackers without a last-seen entry, so the cache must be complete
+        await asyncio.gather(
+            coordinator.async_load_persisted_last_seen(),
+            coordinator.wan_coordinator.accumulators.async_load(),
+        )
+        # The first SSH refreshes are independent of each other. Missing WAN
+        # counters (e.g. an unexpected WAN interface) must not block device
+        # tracking, so that refresh only leaves the WAN sensors unavailable
+        await asyncio.gather(
+            coordinator.async_config_entry_first_refresh(),
+            coordinator.wan_coordinator.async_refresh(),
+        )
     except Exception as ex:
         _LOGGER.error("Failed to initialize coordinator: %s", ex)
+        # Release the SSH session and its worker thread before retrying setup
+        await coordinator.async_shutdown()
         raise ConfigEntryNotReady from ex
 
     # Store coordinator in hass data
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
+    async def _async_close_on_stop(event: Event) -> None:
+        """Close the persistent SSH session when Home Assistant stops."""
+        await coordinator.async_shutdown()
+
+    # Config entries are not unloaded on shutdown, so close the session here
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close_on_stop)
+    )
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
@@ -44,6 +66,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
 
     return unload_ok
@@ -31,24 +31,21 @@ async def validate_ssh_key_file(hass: HomeAssistant, value: str) -> str:
     if not value:
         return value
 
-    if not os.path.exists(value):
-        raise vol.Invalid(f"SSH key file not found: {value}")
+    # All checks hit the filesystem, so run them in a single executor job
+    def _check_file():
+        if not os.path.exists(value):
+            raise vol.Invalid(f"SSH key file not found: {value}")
 
-    if not os.path.isfile(value):
-        raise vol.Invalid(f"SSH key path is not a file: {value}")
+        if not os.path.isfile(value):
+            raise vol.Invalid(f"SSH key path is not a file: {value}")
 
-    # Check if file is readable using async executor
-    def _check_file_readable():
         try:
             with open(value, "r") as f:
                 f.read(1)  # Try to read at least one character
         except (OSError, IOError) as ex:
             raise vol.Invalid(f"Cannot read SSH key file: {ex}") from ex
 
-    try:
-        await hass.async_add_executor_job(_check_file_readable)
-    except vol.Invalid:
-        raise
+    await hass.async_add_executor_job(_check_file)
 
     return value
 
@@ -81,12 +78,16 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         ssh_key=ssh_key,
     )
 
+    def _check_connection() -> None:
+        try:
+            ssh_client.connect()
+        finally:
+            ssh_client.disconnect()
+
     try:
-        await hass.async_add_executor_job(ssh_client.connect)
+        await hass.async_add_executor_job(_check_connection)
     except Exception as ex:
         raise CannotConnect from ex
-    finally:
-        ssh_client.disconnect()
 
     return {"title": f"AsusWrt-Merlin {data[CONF_HOST]}"}
 
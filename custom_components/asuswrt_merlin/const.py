@@ -16,15 +16,27 @@ CONF_SECONDS_UNTIL_AWAY = "seconds_until_away"
 DEFAULT_PORT = 22
 DEFAULT_SECONDS_UNTIL_AWAY = 180
 DEFAULT_MODE = "ssh"
+# Seconds between SSH keepalive packets on the persistent session
+DEFAULT_SSH_KEEPALIVE = 30
 
 # SSH commands
 CMD_ARP = "cat /proc/net/arp"
 CMD_DEVICES = "cat /var/lib/misc/dnsmasq.leases"
 CMD_WAN_IFNAME = "nvram get wan_ifname"
 CMD_PROC_NET_DEV = "cat /proc/net/dev"
+# Separates command outputs when several commands are batched into one exec
+SECTION_MARKER = "===ASUSWRT_MERLIN_SECTION==="
+
+# Bytes per GiB, the unit the WAN data-size sensors report as "GB"
+BYTES_PER_GIB = 1 << 30
+
+# Periods and directions of the accumulating WAN traffic totals
+WAN_PERIODS = ("daily", "monthly", "yearly")
+WAN_DIRECTIONS = ("download", "upload")
 
 # Device tracker attributes
 ATTR_HOSTNAME = "hostname"
 ATTR_MAC = "mac"
 ATTR_IP = "ip"
 ATTR_LAST_SEEN = "last_seen"
+ATTR_IS_CONNECTED = "is_connected"
@@ -3,16 +3,23 @@
 from __future__ import annotations
 
 import logging
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_time_change
 from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
 from .const import (
+    BYTES_PER_GIB,
+    ATTR_IS_CONNECTED,
     ATTR_MAC,
     ATTR_LAST_SEEN,
     ATTR_IP,
@@ -20,14 +27,46 @@ from .const import (
     CONF_SECONDS_UNTIL_AWAY,
     DEFAULT_SECONDS_UNTIL_AWAY,
     DOMAIN,
+    WAN_DIRECTIONS,
+    WAN_PERIODS,
 )
 from .ssh_client import AsusWrtSSHClient
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bytes per megabit (bytes/s divided by this gives Mbps)
+_BYTES_PER_MBIT = 125_000.0
+
+# Marker for the columnar last-seen store layout (macs/ts/hosts lists)
+_STORE_LAYOUT_COLUMNAR = 2
+
+# WAN speeds are averaged over recent counter samples spanning at most this
+# many seconds, so a single short or missed poll doesn't spike the sensors
+_WAN_SPEED_WINDOW = 120.0
+_WAN_SPEED_MAX_SAMPLES = 10
+
+# Device polling backs off from the base interval, doubling after this many
+# consecutive polls without presence changes, up to the maximum interval or
+# the configured away timeout, whichever is shorter
+_BASE_UPDATE_INTERVAL = timedelta(seconds=60)
+_MAX_UPDATE_INTERVAL = timedelta(minutes=5)
+_IDLE_POLLS_BEFORE_BACKOFF = 3
+
+# Seconds between pings that refresh the router's ARP entries
+_CLIENTS_PING_INTERVAL = 300.0
+
+# Upper bound on MACs remembered in mac_last_seen/mac_hostname
+_MAX_TRACKED_MACS = 5000
+
 
 class AsusWrtMerlinDataUpdateCoordinator(DataUpdateCoordinator):
-    """Coordinator to fetch devices and WAN stats in one SSH session."""
+    """Coordinator to fetch connected devices over a persistent SSH session.
+
+    WAN counters change much faster than the client list, so they are polled
+    by a separate AsusWrtMerlinWanCoordinator sharing the same SSH session.
+    Device polls read the WAN counters in the same command and hand them to
+    that coordinator, which then only polls in between.
+    """
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
@@ -40,234 +79,348 @@ class AsusWrtMerlinDataUpdateCoordinator(DataUpdateCoordinator):
             password=entry.data.get("password"),
             ssh_key=entry.data.get("ssh_key"),
         )
+        # Dedicated thread so slow SSH I/O never ties up HA's shared executor
+        self._executor: ThreadPoolExecutor | None = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"{DOMAIN}_{entry.entry_id}"
+        )
+        # Router device shared by every entity of this entry
+        self.device_info: dict[str, Any] = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": f"AsusWrt-Merlin router {entry.data['host']}",
+            "manufacturer": "ASUS",
+            "model": "AsusWrt-Merlin router",
+        }
         self.seconds_until_away = entry.data.get(
             CONF_SECONDS_UNTIL_AWAY,
             DEFAULT_SECONDS_UNTIL_AWAY,
         )
+        # Backing off past the away timeout would delay arrivals and
+        # departures beyond it, so it caps the polling interval too
+        self._max_update_interval = max(
+            _BASE_UPDATE_INTERVAL,
+            min(_MAX_UPDATE_INTERVAL, timedelta(seconds=self.seconds_until_away)),
+        )
 
         self.last_update_time: datetime | None = None
         self.known_devices: set[str] = set()
+        # Latest devices keyed by MAC, so entities can look themselves up in O(1)
+        self.data_by_mac: dict[str, dict[str, Any]] = {}
+        # Connection status and counts, classified once per refresh
+        self.home_macs: set[str] = set()
+        self._connected_macs: set[str] = set()
+        self._idle_polls = 0
+        self.active_count = 0
+        self.recently_seen_count = 0
+        self.offline_count = 0
+        # Device statistics for the router sensor's attributes
+        self.router_attrs: dict[str, int] = {
+            "total_devices": 0,
+            "active_devices": 0,
+            "recently_seen_devices": 0,
+            "offline_devices": 0,
+        }
         self.new_devices_callback = None
-        self.mac_last_seen: dict[str, datetime] = {}
+        # Least recently updated first, so the cap evicts the stalest MACs
+        self.mac_last_seen: OrderedDict[str, datetime] = OrderedDict()
         self.mac_hostname: dict[str, str] = {}
         self._prune_threshold: timedelta = timedelta(days=30)
+        # A 30-day cutoff doesn't need checking on every poll
+        self._prune_interval: timedelta = timedelta(hours=1)
+        self._last_prune: datetime | None = None
+        # Persist last-seen data only when it changed, at most every 5 minutes
+        self._persist_delay: float = 300
+        self._last_seen_dirty = False
+        self._persist_pending = False
         self._store: Store = Store(
             hass,
             version=1,
             key=f"{DOMAIN}_{entry.entry_id}_last_seen",
         )
 
-        # WAN traffic tracking
-        self._last_wan_rx_bytes: int | None = None
-        self._last_wan_tx_bytes: int | None = None
-        self._last_wan_sample_time: datetime | None = None
-        self.wan_total_download_gb: float | None = None
-        self.wan_total_upload_gb: float | None = None
-        self.wan_download_mbps: float | None = None
-        self.wan_upload_mbps: float | None = None
-        self.wan_last_rx_delta_bytes: int | None = None
-        self.wan_last_tx_delta_bytes: int | None = None
+        # Throttle client refreshes to avoid running update_clients too often;
+        # monotonic so a wall-clock jump can't stall or repeat the pings
+        self._last_clients_ping: float | None = None
 
-        # Throttle client refreshes to avoid running update_clients too often
-        self._last_clients_ping: datetime | None = None
+        # Our device_tracker registry entries keyed by unique_id (MAC); rebuilt
+        # lazily after any entity registry change
+        self._tracker_cache: dict[str, er.RegistryEntry] | None = None
+        self._unsub_registry_listener = hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, self._invalidate_registry_cache
+        )
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=30),
+            update_interval=_BASE_UPDATE_INTERVAL,
         )
 
+        self.wan_coordinator = AsusWrtMerlinWanCoordinator(hass, entry, self)
+
     def _iter_our_device_tracker_entries(self, registry):
-        """Yield entity registry entries for this config entry's device_trackers on our platform."""
-        try:
-            entries = er.async_entries_for_config_entry(registry, self.entry.entry_id)
-        except Exception:
-            entries = []
-        for entity_entry in entries:
-            try:
-                if entity_entry.domain != "device_tracker":
-                    continue
-                if entity_entry.platform != DOMAIN:
-                    continue
-                yield entity_entry
-            except Exception:
+        """Return entity registry entries for this config entry's device_trackers on our platform."""
+        if self._tracker_cache is None:
+            self._tracker_cache = self._build_tracker_cache(registry)
+        return self._tracker_cache.values()
+
+    def _build_tracker_cache(self, registry) -> dict[str, er.RegistryEntry]:
+        """Map unique_id to registry entry for our device_tracker entities."""
+        cache: dict[str, er.RegistryEntry] = {}
+        for entity_entry in er.async_entries_for_config_entry(
+            registry, self.entry.entry_id
+        ):
+            if entity_entry.domain != "device_tracker":
                 continue
+            if entity_entry.platform != DOMAIN:
+                continue
+            cache[entity_entry.unique_id] = entity_entry
+        return cache
+
+    @callback
+    def _invalidate_registry_cache(self, event: Event) -> None:
+        """Drop the cached tracker entries when the entity registry changes."""
+        self._tracker_cache = None
+
+    async def async_run_ssh_job(self, target, *args):
+        """Run blocking SSH work on this entry's dedicated executor thread."""
+        return await self.hass.loop.run_in_executor(self._executor, target, *args)
 
     async def _async_update_data(self) -> list[dict[str, Any]]:
-        """Update devices and WAN stats via SSH (single session)."""
+        """Update connected devices via SSH."""
         try:
             _LOGGER.debug("Starting data update")
-            devices, wan_stats = await self.hass.async_add_executor_job(
-                self._get_data_from_router
+            # Registry access must stay on the event loop, so pick ping targets here
+            ping_ips = self._get_ips_to_ping()
+            devices, wan_stats = await self.async_run_ssh_job(
+                self._get_data_from_router, ping_ips
             )
-            self.last_update_time = datetime.now()
+            now = datetime.now()
+            self.last_update_time = now
+
+            if wan_stats:
+                self.wan_coordinator.async_set_wan_counters(wan_stats)
 
             if not isinstance(devices, list):
                 _LOGGER.warning("Expected list of devices, got %s", type(devices))
                 devices = []
 
-            if devices:
-                mac_to_device = {
-                    device.get(ATTR_MAC): device
-                    for device in devices
-                    if isinstance(device, dict) and device.get(ATTR_MAC)
-                }
-                current_device_macs = set(mac_to_device.keys())
-                new_devices = current_device_macs - self.known_devices
-                if new_devices:
-                    # Only store newly discovered devices if they are currently connected
-                    connected_new_devices = {
-                        mac
-                        for mac in new_devices
-                        if mac_to_device.get(mac, {}).get("is_connected", False)
-                    }
-                    if connected_new_devices:
-                        self.known_devices.update(connected_new_devices)
-                        if self.new_devices_callback:
-                            new_device_data = [
-                                mac_to_device[mac]
-                                for mac in connected_new_devices
-                                if isinstance(mac_to_device.get(mac), dict)
-                            ]
-                            await self.new_devices_callback(new_device_data)
-
-                # Update last seen timestamps for pruning
-                now = datetime.now()
-                for device in devices:
+            # Drop malformed records once so the loop below needs no guards
+            devices = [d for d in devices if isinstance(d, dict) and d.get(ATTR_MAC)]
+
+            # Single pass: index devices by MAC, track hostnames and last-seen
+            # timestamps, and backfill last_seen for disconnected devices so
+            # trackers can apply the grace period (seconds_until_away)
+            mac_to_device: dict[str, dict[str, Any]] = {}
+            connected_macs: set[str] = set()
+            # Connected, or seen within seconds_until_away of this refresh
+            home_macs: set[str] = set()
+            away_cutoff = now - timedelta(seconds=self.seconds_until_away)
+            # Hoisted for the hot loop below
+            mac_last_seen = self.mac_last_seen
+            mac_hostname = self.mac_hostname
+            set_last_seen = self._set_last_seen
+            dirty = False
+            for device in devices:
+                mac = device[ATTR_MAC]
+                mac_to_device[mac] = device
+                # Track hostname when available
+                host = device.get(ATTR_HOSTNAME)
+                if (
+                    isinstance(host, str)
+                    and host.strip()
+                    and mac_hostname.get(mac) != host
+                ):
+                    mac_hostname[mac] = host
+                    dirty = True
+                # If currently connected, consider seen now
+                if device.get(ATTR_IS_CONNECTED, False):
+                    connected_macs.add(mac)
+                    home_macs.add(mac)
+                    set_last_seen(mac, now)
+                    dirty = True
+                    continue
+                # Else, use last_seen if available, normalized to a datetime
+                # so entities never have to parse it
+                last_seen = device.get(ATTR_LAST_SEEN)
+                if isinstance(last_seen, str):
                     try:
-                        if not isinstance(device, dict):
-                            continue
-                        mac = device.get(ATTR_MAC)
-                        if not mac:
-                            continue
-                        # Track hostname when available
-                        host = device.get(ATTR_HOSTNAME)
-                        if isinstance(host, str) and host.strip():
-                            self.mac_hostname[mac] = host
-                        # If currently connected, consider seen now
-                        if device.get("is_connected", False):
-                            self.mac_last_seen[mac] = now
-                            continue
-                        # Else, use last_seen if available
-                        last_seen = device.get(ATTR_LAST_SEEN)
-                        if last_seen is not None:
-                            if isinstance(last_seen, str):
-                                try:
-                                    last_seen = datetime.fromisoformat(last_seen)
-                                except Exception:
-                                    # Skip unparsable timestamps
-                                    continue
-                            if isinstance(last_seen, datetime):
-                                self.mac_last_seen[mac] = last_seen
-                    except Exception:
-                        # Never let a single bad device break the cycle
-                        continue
-
-            if wan_stats:
-                self._update_wan_metrics(wan_stats)
+                        last_seen = datetime.fromisoformat(last_seen)
+                    except ValueError:
+                        # Drop unparsable timestamps
+                        last_seen = None
+                if isinstance(last_seen, datetime):
+                    device[ATTR_LAST_SEEN] = last_seen
+                    if mac_last_seen.get(mac) != last_seen:
+                        set_last_seen(mac, last_seen)
+                        dirty = True
+                else:
+                    last_seen = mac_last_seen.get(mac)
+                    device[ATTR_LAST_SEEN] = last_seen
+                if last_seen is not None and last_seen > away_cutoff:
+                    home_macs.add(mac)
+            if dirty:
+                self._last_seen_dirty = True
+            self.data_by_mac = mac_to_device
+            self._adapt_update_interval(
+                home_macs == self.home_macs and connected_macs == self._connected_macs
+            )
+            self.home_macs = home_macs
+            self._connected_macs = connected_macs
+            # Device counts for the router sensor, so it never walks the data
+            self.active_count = len(connected_macs)
+            self.recently_seen_count = len(home_macs)
+            self.offline_count = len(mac_to_device) - len(home_macs)
+            self.router_attrs = {
+                "total_devices": len(mac_to_device),
+                "active_devices": self.active_count,
+                "recently_seen_devices": self.recently_seen_count,
+                "offline_devices": self.offline_count,
+            }
+
+            # Only store newly discovered devices if they are currently connected
+            connected_new_devices = connected_macs - self.known_devices
+            if connected_new_devices:
+                self.known_devices.update(connected_new_devices)
+                if self.new_devices_callback:
+                    self.new_devices_callback(
+                        [mac_to_device[mac] for mac in connected_new_devices]
+                    )
 
             _LOGGER.debug("Data update completed successfully")
-            # Prune stale device_tracker entities asynchronously
-            await self._async_prune_stale_entities()
-            # Persist last seen map
-            await self._async_save_persisted_last_seen()
-            # Ensure disconnected devices carry a last_seen equal to their last seen time
-            # so that trackers can apply the grace period (seconds_until_away)
-            try:
-                if devices:
-                    for device in devices:
-                        try:
-                            if not isinstance(device, dict):
-                                continue
-                            mac = device.get(ATTR_MAC)
-                            if not mac:
-                                continue
-                            if device.get("is_connected", False):
-                                # Connected devices already updated above
-                                continue
-                            has_last = device.get(ATTR_LAST_SEEN) is not None
-                            if not has_last:
-                                last_seen = self.mac_last_seen.get(mac)
-                                if last_seen is not None:
-                                    device[ATTR_LAST_SEEN] = last_seen
-                        except Exception:
-                            continue
-            except Exception:
-                # Non-fatal enrichment failure should not break updates
-                pass
+            # Registry pruning is synchronous, so run it inline rather than
+            # as a separate task
+            if (
+                self._last_prune is None
+                or now - self._last_prune >= self._prune_interval
+            ):
+                self._last_prune = now
+                self._async_prune_stale_entities()
+            # Persist last seen map (debounced, only when changed)
+            self._async_save_persisted_last_seen()
             return devices
+        except UpdateFailed:
+            raise
         except Exception as ex:
             _LOGGER.error("Error in _async_update_data: %s", ex, exc_info=True)
             raise UpdateFailed(f"Error communicating with router: {ex}") from ex
 
+    def _ensure_connected(self) -> None:
+        """Open the persistent SSH session, reusing it while it is alive."""
+        self.ssh_client.ensure_connected()
+
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled refresh and close the SSH session."""
+        await super().async_shutdown()
+        await self.wan_coordinator.async_shutdown()
+        if self._unsub_registry_listener:
+            self._unsub_registry_listener()
+            self._unsub_registry_listener = None
+        # May be called both by HA on unload and by async_unload_entry
+        if self._executor is None:
+            return
+        executor, self._executor = self._executor, None
+        await self.hass.loop.run_in_executor(executor, self.ssh_client.disconnect)
+        executor.shutdown(wait=False)
+
     def _get_data_from_router(
-        self,
+        self, ping_ips: list[str]
     ) -> tuple[list[dict[str, Any]], dict[str, int] | None]:
-        """Fetch all data using a single SSH connection."""
-        try:
-            self.ssh_client.connect()
-            devices = self.ssh_client.get_connected_devices()
-            wan_stats = self.ssh_client.get_wan_counters()
-
-            # Determine if we should run pings on this cycle
-            should_ping = False
-            try:
-                now = datetime.now()
-                if self._last_clients_ping is None or (
-                    now - self._last_clients_ping
-                ) >= timedelta(minutes=5):
-                    should_ping = True
-            except Exception:
-                should_ping = False
-
-            # If due, ping only devices currently marked as connected
-            if should_ping and isinstance(devices, list) and devices:
-                try:
-                    # Build set of enabled device_tracker MACs for this entry
-                    enabled_macs: set[str] = set()
-                    try:
-                        registry = er.async_get(self.hass)
-                        for entity_entry in self._iter_our_device_tracker_entries(
-                            registry
-                        ):
-                            # Only include entities that are not disabled in the registry
-                            if (
-                                getattr(entity_entry, "disabled_by", None) is None
-                                and entity_entry.unique_id
-                            ):
-                                enabled_macs.add(entity_entry.unique_id)
-                    except Exception:
-                        enabled_macs = set()
-
-                    ips = [
-                        d.get(ATTR_IP)
-                        for d in devices
-                        if isinstance(d, dict)
-                        and d.get("is_connected", False)
-                        and d.get(ATTR_IP)
-                        and d.get(ATTR_MAC) in enabled_macs
-                    ]
-                    if ips:
-                        _LOGGER.debug(
-                            "Pinging %d connected device IPs: %s",
-                            len(ips),
-                            ", ".join(ips),
-                        )
-                        self.ssh_client.ping_ips(ips)
-                        self._last_clients_ping = datetime.now()
-                except Exception:
-                    pass
+        """Fetch all data with one batched command on the persistent SSH connection.
 
+        Raises if the fetch fails, so an empty device list always means the
+        router has no leases rather than that nothing came back.
+        """
+        try:
+            self._ensure_connected()
+            devices, wan_stats = self.ssh_client.get_all(ping_ips)
+            if ping_ips:
+                self._last_clients_ping = time.monotonic()
             return devices, wan_stats
-        except Exception as ex:
-            _LOGGER.error("SSH fetch failed: %s", ex, exc_info=True)
-            return [], None
-        finally:
+        except Exception:
+            # Drop the session so the next poll starts from a fresh connection
             self.ssh_client.disconnect()
+            raise
+
+    @callback
+    def _get_ips_to_ping(self) -> list[str]:
+        """Return IPs of enabled, connected trackers if a ping refresh is due.
+
+        Pings run after the ARP table has been read within the same batched
+        command, so they refresh ARP for the next poll; the previous poll's
+        device list is used to pick the targets.
+        """
+        # Determine if we should run pings on this cycle
+        should_ping = (
+            self._last_clients_ping is None
+            or time.monotonic() - self._last_clients_ping >= _CLIENTS_PING_INTERVAL
+        )
+
+        devices = self.data
+        # If due, ping only devices currently marked as connected
+        if not should_ping or not devices:
+            return []
+
+        # Build set of enabled device_tracker MACs for this entry
+        registry = er.async_get(self.hass)
+        enabled_macs = {
+            entity_entry.unique_id
+            for entity_entry in self._iter_our_device_tracker_entries(registry)
+            # Only include entities that are not disabled in the registry
+            if entity_entry.disabled_by is None and entity_entry.unique_id
+        }
+
+        ips = [
+            d[ATTR_IP]
+            for d in devices
+            if d.get(ATTR_IS_CONNECTED, False)
+            and d.get(ATTR_IP)
+            and d[ATTR_MAC] in enabled_macs
+        ]
+        if ips and _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Pinging %d connected device IPs: %s",
+                len(ips),
+                ", ".join(ips),
+            )
+        return ips
+
+    def _adapt_update_interval(self, idle: bool) -> None:
+        """Back off polling while presence is stable; reset on any change."""
+        if not idle:
+            self._reset_update_interval()
+            return
+        self._idle_polls += 1
+        if self._idle_polls >= _IDLE_POLLS_BEFORE_BACKOFF:
+            self._idle_polls = 0
+            self.update_interval = min(
+                self.update_interval * 2, self._max_update_interval
+            )
+
+    def _reset_update_interval(self) -> None:
+        """Return to the base polling interval."""
+        self._idle_polls = 0
+        self.update_interval = _BASE_UPDATE_INTERVAL
+
+    async def async_request_refresh(self) -> None:
+        """Refresh on request (e.g. the update entity service) at the base rate."""
+        self._reset_update_interval()
+        await super().async_request_refresh()
+
+    def _set_last_seen(self, mac: str, last_seen: datetime) -> None:
+        """Record when mac was last seen, evicting the stalest MACs past the cap."""
+        mac_last_seen = self.mac_last_seen
+        mac_last_seen[mac] = last_seen
+        mac_last_seen.move_to_end(mac)
+        while len(mac_last_seen) > _MAX_TRACKED_MACS:
+            evicted, _ = mac_last_seen.popitem(last=False)
+            self.mac_hostname.pop(evicted, None)
 
     def set_new_devices_callback(self, callback) -> None:
-        """Set callback for new device notifications."""
+        """Set callback for new device notifications.
+
+        The callback must be a synchronous @callback; it is called directly
+        from the event loop during a refresh.
+        """
         self.new_devices_callback = callback
 
     async def async_load_persisted_last_seen(self) -> None:
@@ -276,100 +429,364 @@ class AsusWrtMerlinDataUpdateCoordinator(DataUpdateCoordinator):
             data = await self._store.async_load()
             if not data or not isinstance(data, dict):
                 return
-            for mac, stored in data.items():
-                if not isinstance(stored, dict):
-                    continue
-                ts = stored.get("last_seen")
-                host = stored.get("hostname")
-                if isinstance(ts, str):
+            if data.get("v") == _STORE_LAYOUT_COLUMNAR:
+                records = zip(data["macs"], data["ts"], data["hosts"])
+            else:
+                # Original layout: {mac: {"last_seen": ..., "hostname": ...}}
+                records = (
+                    (mac, stored.get("last_seen"), stored.get("hostname"))
+                    for mac, stored in data.items()
+                    if isinstance(stored, dict)
+                )
+            # The first refresh may already have run, so never let stored
+            # values replace fresher ones observed at runtime
+            for mac, ts, host in records:
+                last_seen: datetime | None = None
+                if isinstance(ts, (int, float)):
+                    try:
+                        last_seen = datetime.fromtimestamp(ts)
+                    except (OverflowError, OSError, ValueError):
+                        pass
+                elif isinstance(ts, str):
+                    # Older stores saved ISO 8601 strings
                     try:
-                        self.mac_last_seen[mac] = datetime.fromisoformat(ts)
-                    except Exception:
+                        last_seen = datetime.fromisoformat(ts)
+                    except ValueError:
                         pass
+                if last_seen is not None:
+                    current = self.mac_last_seen.get(mac)
+                    if current is None or last_seen > current:
+                        self._set_last_seen(mac, last_seen)
                 if isinstance(host, str) and host.strip():
-                    self.mac_hostname[mac] = host
+                    self.mac_hostname.setdefault(mac, host)
         except Exception as ex:
             _LOGGER.debug("Failed to load persisted last_seen: %s", ex)
 
-    async def _async_save_persisted_last_seen(self) -> None:
-        """Persist last-seen timestamps to storage, along with hostnames."""
-        try:
-            serializable: dict[str, dict[str, str]] = {}
-            for mac, ts in self.mac_last_seen.items():
-                if not isinstance(ts, datetime):
-                    continue
-                entry: dict[str, str] = {"last_seen": ts.isoformat()}
-                host = self.mac_hostname.get(mac)
-                if isinstance(host, str) and host.strip():
-                    entry["hostname"] = host
-                serializable[mac] = entry
-            await self._store.async_save(serializable)
-        except Exception as ex:
-            _LOGGER.debug("Failed to save persisted last_seen: %s", ex)
+    @callback
+    def _async_save_persisted_last_seen(self) -> None:
+        """Schedule a delayed write of last-seen timestamps if they changed.
+
+        The Store serializes the data when the delay expires (or on shutdown),
+        so polls in between only mark the map dirty.
+        """
+        if not self._last_seen_dirty or self._persist_pending:
+            return
+        self._persist_pending = True
+        self._store.async_delay_save(
+            self._get_last_seen_serializable, self._persist_delay
+        )
 
-    async def _async_prune_stale_entities(self) -> None:
+    @callback
+    def _get_last_seen_serializable(self) -> dict[str, Any]:
+        """Return last-seen epoch timestamps and hostnames as parallel lists."""
+        self._persist_pending = False
+        self._last_seen_dirty = False
+        macs: list[str] = []
+        ts_list: list[float] = []
+        hosts: list[str | None] = []
+        mac_hostname = self.mac_hostname
+        for mac, ts in self.mac_last_seen.items():
+            if not isinstance(ts, datetime):
+                continue
+            macs.append(mac)
+            ts_list.append(ts.timestamp())
+            hosts.append(mac_hostname.get(mac))
+        return {
+            "v": _STORE_LAYOUT_COLUMNAR,
+            "macs": macs,
+            "ts": ts_list,
+            "hosts": hosts,
+        }
+
+    @callback
+    def _async_prune_stale_entities(self) -> None:
         """Remove old device_tracker entities not seen for over the prune threshold."""
         try:
             registry = er.async_get(self.hass)
             cutoff = datetime.now() - self._prune_threshold
-            # Iterate over all entities and filter to our platform/domain/entry
-            for entity_entry in self._iter_our_device_tracker_entries(registry):
+            # Copy the cached entries: removals below invalidate the cache
+            for entity_entry in list(self._iter_our_device_tracker_entries(registry)):
+                mac = entity_entry.unique_id
+                if not mac:
+                    continue
+                last_seen = self.mac_last_seen.get(mac)
+                if last_seen is not None and last_seen >= cutoff:
+                    continue
+                _LOGGER.info(
+                    "Pruning stale device_tracker entity %s (MAC %s, last seen %s)",
+                    entity_entry.entity_id,
+                    mac,
+                    last_seen,
+                )
                 try:
-                    mac = entity_entry.unique_id
-                    if not mac:
-                        continue
-                    last_seen = self.mac_last_seen.get(mac)
-                    if last_seen is None or last_seen < cutoff:
-                        _LOGGER.info(
-                            "Pruning stale device_tracker entity %s (MAC %s, last seen %s)",
-                            entity_entry.entity_id,
-                            mac,
-                            last_seen,
-                        )
-                        registry.async_remove(entity_entry.entity_id)
-                        self.known_devices.discard(mac)
-                        self.mac_hostname.pop(mac, None)
-                except Exception:
-                    # Continue pruning other entities even if one fails
+                    registry.async_remove(entity_entry.entity_id)
+                except KeyError:
+                    # Already removed; continue pruning the others
                     continue
+                self.known_devices.discard(mac)
+                if self.mac_hostname.pop(mac, None) is not None:
+                    self._last_seen_dirty = True
+
+            # Forget MACs past the threshold even when they never had an entity
+            stale_macs = [
+                mac
+                for mac, last_seen in self.mac_last_seen.items()
+                if last_seen < cutoff
+            ]
+            for mac in stale_macs:
+                del self.mac_last_seen[mac]
+                self.mac_hostname.pop(mac, None)
+            if stale_macs:
+                self._last_seen_dirty = True
         except Exception as ex:
             _LOGGER.debug("Pruning stale entities failed: %s", ex)
 
+
+class AsusWrtMerlinWanCoordinator(DataUpdateCoordinator):
+    """Coordinator to poll WAN byte counters on their own, faster cadence."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        device_coordinator: AsusWrtMerlinDataUpdateCoordinator,
+    ) -> None:
+        """Initialize the coordinator."""
+        self.entry = entry
+        # Shares the device coordinator's SSH session and executor thread
+        self._device_coordinator = device_coordinator
+        self.ssh_client = device_coordinator.ssh_client
+        # WAN sensors belong to the same router device
+        self.device_info = device_coordinator.device_info
+        self.last_update_time: datetime | None = None
+
+        # WAN traffic tracking: recent (monotonic time, rx, tx) samples, oldest
+        # first; monotonic so NTP/DST wall-clock jumps can't skew Mbps
+        self._wan_samples: deque[tuple[float, int, int]] = deque(
+            maxlen=_WAN_SPEED_MAX_SAMPLES
+        )
+        self.wan_total_download_gb: float | None = None
+        self.wan_total_upload_gb: float | None = None
+        self.wan_download_mbps: float | None = None
+        self.wan_upload_mbps: float | None = None
+        # Current marker per period for the accumulating sensors; only
+        # changes at midnight
+        self.wan_period_markers: dict[str, str] = self._period_markers(dt_util.now())
+        # Daily/monthly/yearly totals shared by the accumulating sensors
+        self.accumulators = AsusWrtMerlinWanAccumulators(
+            hass, entry, self.wan_period_markers
+        )
+        self._unsub_period_rollover = async_track_time_change(
+            hass, self._async_roll_period_markers, hour=0, minute=0, second=0
+        )
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_wan",
+            update_interval=timedelta(seconds=30),
+        )
+
+    @staticmethod
+    def _period_markers(now: datetime) -> dict[str, str]:
+        """Return the daily, monthly and yearly period markers for now."""
+        return {
+            "daily": now.strftime("%Y-%m-%d"),
+            "monthly": now.strftime("%Y-%m"),
+            "yearly": now.strftime("%Y"),
+        }
+
+    @callback
+    def _async_roll_period_markers(self, now: datetime) -> None:
+        """Move the period markers on at midnight."""
+        self.wan_period_markers = self._period_markers(now)
+
+    async def async_shutdown(self) -> None:
+        """Cancel scheduled refreshes and the midnight rollover."""
+        await super().async_shutdown()
+        if self._unsub_period_rollover:
+            self._unsub_period_rollover()
+            self._unsub_period_rollover = None
+
+    async def _async_update_data(self) -> dict[str, int]:
+        """Update WAN byte counters via SSH."""
+        try:
+            counters = await self._device_coordinator.async_run_ssh_job(
+                self._get_wan_counters_from_router
+            )
+        except Exception as ex:
+            counters = None
+            _LOGGER.error("WAN counters fetch failed: %s", ex)
+        if not counters:
+            raise UpdateFailed("No WAN counters received from router")
+
+        self.last_update_time = datetime.now()
+        self._update_wan_metrics(counters)
+        return counters
+
+    @callback
+    def async_set_wan_counters(self, counters: dict[str, int]) -> None:
+        """Publish counters read by the device coordinator's poll.
+
+        This also pushes back this coordinator's next scheduled poll.
+        """
+        self.last_update_time = datetime.now()
+        self._update_wan_metrics(counters)
+        self.async_set_updated_data(counters)
+
+    def _get_wan_counters_from_router(self) -> dict[str, int] | None:
+        """Fetch WAN counters on the persistent SSH connection."""
+        try:
+            self.ssh_client.ensure_connected()
+            return self.ssh_client.get_wan_counters()
+        except Exception:
+            # Drop the session so the next poll starts from a fresh connection
+            self.ssh_client.disconnect()
+            raise
+
     def _update_wan_metrics(self, counters: dict[str, int]) -> None:
         """Compute WAN totals in GB and speeds in Mbps from byte counters."""
-        now = datetime.now()
+        mono = time.monotonic()
         rx_bytes = counters.get("rx_bytes")
         tx_bytes = counters.get("tx_bytes")
         if rx_bytes is None or tx_bytes is None:
             return
 
         # Totals in GB (base-2 as GB per earlier choice)
-        self.wan_total_download_gb = rx_bytes / (1024**3)
-        self.wan_total_upload_gb = tx_bytes / (1024**3)
-
-        # Speeds
-        rx_delta: int | None = None
-        tx_delta: int | None = None
-
-        if (
-            self._last_wan_rx_bytes is not None
-            and self._last_wan_tx_bytes is not None
-            and self._last_wan_sample_time is not None
-        ):
-            elapsed = (now - self._last_wan_sample_time).total_seconds()
+        self.wan_total_download_gb = rx_bytes / BYTES_PER_GIB
+        self.wan_total_upload_gb = tx_bytes / BYTES_PER_GIB
+
+        # Per-poll deltas for the accumulators, against the previous sample
+        rx_delta = 0
+        tx_delta = 0
+        samples = self._wan_samples
+        if samples:
+            _, last_rx, last_tx = samples[-1]
+            if rx_bytes < last_rx or tx_bytes < last_tx:
+                # Counters reset (router reboot or wrap): restart the window
+                samples.clear()
+                self.wan_download_mbps = 0.0
+                self.wan_upload_mbps = 0.0
+            else:
+                rx_delta = rx_bytes - last_rx
+                tx_delta = tx_bytes - last_tx
+        samples.append((mono, rx_bytes, tx_bytes))
+
+        # Speeds over the rolling window: the counters are cumulative, so the
+        # window's traffic is just newest minus oldest
+        while len(samples) > 2 and mono - samples[0][0] > _WAN_SPEED_WINDOW:
+            samples.popleft()
+        if len(samples) > 1:
+            first_mono, first_rx, first_tx = samples[0]
+            elapsed = mono - first_mono
             if elapsed > 0:
-                rx_delta = max(0, rx_bytes - self._last_wan_rx_bytes)
-                tx_delta = max(0, tx_bytes - self._last_wan_tx_bytes)
-                self.wan_download_mbps = (rx_delta * 8) / 1_000_000.0 / elapsed
-                self.wan_upload_mbps = (tx_delta * 8) / 1_000_000.0 / elapsed
-        else:
-            rx_delta = None
-            tx_delta = None
-
-        self._last_wan_rx_bytes = rx_bytes
-        self._last_wan_tx_bytes = tx_bytes
-        self._last_wan_sample_time = now
-
-        # Expose deltas for sensors to accumulate
-        self.wan_last_rx_delta_bytes = rx_delta if rx_delta is not None else 0
-        self.wan_last_tx_delta_bytes = tx_delta if tx_delta is not None else 0
+                self.wan_download_mbps = (rx_bytes - first_rx) / (
+                    elapsed * _BYTES_PER_MBIT
+                )
+                self.wan_upload_mbps = (tx_bytes - first_tx) / (
+                    elapsed * _BYTES_PER_MBIT
+                )
+
+        self.accumulators.async_add(rx_delta, tx_delta, self.wan_period_markers)
+
+
+class AsusWrtMerlinWanAccumulators:
+    """Daily, monthly and yearly WAN byte totals behind the accumulating sensors.
+
+    All six totals are persisted together in one Store file instead of each
+    sensor restoring its own state.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, markers: dict[str, str]
+    ) -> None:
+        """Initialize empty totals for the current periods."""
+        # Byte totals keyed "<period>_<direction>"
+        self.totals: dict[str, int] = {}
+        # Period marker each period's totals belong to
+        self.markers: dict[str, str] = dict(markers)
+        # Totals loaded from storage; restored sensor states only seed the rest
+        self._stored_keys: set[str] = set()
+        self._save_delay: float = 60
+        self._save_pending = False
+        self._store: Store = Store(
+            hass,
+            version=1,
+            key=f"{DOMAIN}_{entry.entry_id}_wan_totals",
+        )
+
+    async def async_load(self) -> None:
+        """Load persisted totals, keeping only those for the current periods."""
+        try:
+            data = await self._store.async_load()
+            if not data or not isinstance(data, dict):
+                return
+            totals = data.get("totals") or {}
+            markers = data.get("markers") or {}
+            for period in WAN_PERIODS:
+                if markers.get(period) != self.markers.get(period):
+                    # Stored totals belong to a period that has since ended
+                    continue
+                for direction in WAN_DIRECTIONS:
+                    key = f"{period}_{direction}"
+                    value = totals.get(key)
+                    if isinstance(value, int):
+                        # The first refresh may already have added traffic
+                        self.totals[key] = self.totals.get(key, 0) + value
+                        self._stored_keys.add(key)
+        except Exception as ex:
+            _LOGGER.debug("Failed to load persisted WAN totals: %s", ex)
+
+    def has_stored(self, period: str, direction: str) -> bool:
+        """Return True if the total for period/direction came from storage."""
+        return f"{period}_{direction}" in self._stored_keys
+
+    @callback
+    def async_seed(
+        self, period: str, direction: str, value_bytes: int, marker: str | None
+    ) -> None:
+        """Adopt a total restored from sensor state if none was stored.
+
+        Migrates totals kept by the sensors themselves before they were
+        persisted here; a total from an ended period is dropped.
+        """
+        key = f"{period}_{direction}"
+        if key in self._stored_keys:
+            return
+        self._stored_keys.add(key)
+        if marker is None or marker != self.markers.get(period):
+            return
+        self.totals[key] = self.totals.get(key, 0) + value_bytes
+        self._async_schedule_save()
+
+    @callback
+    def async_add(self, rx_bytes: int, tx_bytes: int, markers: dict[str, str]) -> None:
+        """Add one poll's traffic, starting new totals for periods that rolled."""
+        totals = self.totals
+        changed = bool(rx_bytes or tx_bytes)
+        for period, marker in markers.items():
+            download = f"{period}_download"
+            upload = f"{period}_upload"
+            if self.markers.get(period) != marker:
+                self.markers[period] = marker
+                totals[download] = 0
+                totals[upload] = 0
+                changed = True
+            totals[download] = totals.get(download, 0) + rx_bytes
+            totals[upload] = totals.get(upload, 0) + tx_bytes
+        if changed:
+            self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule one delayed write covering all changes until it runs."""
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, self._save_delay)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the totals and their period markers."""
+        self._save_pending = False
+        return {"totals": dict(self.totals), "markers": dict(self.markers)}
@@ -3,16 +3,18 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+import sys
+from collections.abc import Iterator
 from typing import Any
 
 from homeassistant.components.device_tracker import ScannerEntity
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
+    ATTR_IS_CONNECTED,
     ATTR_HOSTNAME,
     ATTR_IP,
     ATTR_LAST_SEEN,
@@ -23,6 +25,9 @@ from .coordinator import AsusWrtMerlinDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Drops MAC separators in a single pass when comparing MACs and hostnames
+_STRIP = str.maketrans("", "", ":-")
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -41,54 +46,44 @@ async def async_setup_entry(
     )
     coordinator.known_devices = set(data_macs)
 
-    entities = []
-    # Create entities for devices present in the current data
-    for device in data_devices:
-        entities.append(AsusWrtMerlinDeviceTracker(coordinator, device))
-
-    # Also create entities for devices only known via persisted last_seen cache
     offline_only_macs = cached_macs - data_macs
-    for mac in offline_only_macs:
-        last_seen = coordinator.mac_last_seen.get(mac)
-        hostname = None
-        try:
-            hostname = coordinator.mac_hostname.get(mac)
-        except Exception:
-            hostname = None
-        # Synthesize a minimal device record so the tracker can render as offline
-        synth_device = {
-            ATTR_MAC: mac,
-            ATTR_HOSTNAME: hostname or mac,  # fallback label
-            ATTR_LAST_SEEN: last_seen,
-            "is_connected": False,
-        }
-        entities.append(AsusWrtMerlinDeviceTracker(coordinator, synth_device))
+
+    def _initial_entities() -> Iterator[AsusWrtMerlinDeviceTracker]:
+        """Yield trackers for current devices, then cached offline-only ones."""
+        # Create entities for devices present in the current data
+        for device in data_devices:
+            yield AsusWrtMerlinDeviceTracker(coordinator, device)
+
+        # Also create entities for devices only known via persisted last_seen cache
+        for mac in offline_only_macs:
+            # Synthesize a minimal device record so the tracker can render as offline
+            synth_device = {
+                ATTR_MAC: mac,
+                ATTR_HOSTNAME: coordinator.mac_hostname.get(mac) or mac,  # fallback
+                ATTR_LAST_SEEN: coordinator.mac_last_seen.get(mac),
+                ATTR_IS_CONNECTED: False,
+            }
+            yield AsusWrtMerlinDeviceTracker(coordinator, synth_device)
 
     # Do not force an immediate refresh on add; rely on restored state/coordinator
     # to avoid temporary 'unavailable' or state flapping during reloads.
-    async_add_entities(entities, False)
+    async_add_entities(_initial_entities(), False)
 
     # Set up callback for new devices
-    async def handle_new_devices(new_devices: list[dict[str, Any]]) -> None:
+    @callback
+    def handle_new_devices(new_devices: list[dict[str, Any]]) -> None:
         """Handle new devices that appear on the router."""
-        new_entities = []
-        for device in new_devices:
-            new_entities.append(AsusWrtMerlinDeviceTracker(coordinator, device))
-
-        if new_entities:
-            _LOGGER.info("Adding %d new device entities", len(new_entities))
+        if new_devices:
+            _LOGGER.info("Adding %d new device entities", len(new_devices))
             # Avoid update_before_add to prevent brief state flips for existing entities
-            async_add_entities(new_entities, False)
+            async_add_entities(
+                (AsusWrtMerlinDeviceTracker(coordinator, d) for d in new_devices),
+                False,
+            )
 
     coordinator.set_new_devices_callback(handle_new_devices)
 
 
-class AsusWrtMerlinDataUpdateCoordinator(AsusWrtMerlinDataUpdateCoordinator):
-    """Backwards-compatible alias imported by device_tracker and sensor modules."""
-
-    pass
-
-
 class AsusWrtMerlinDeviceTracker(ScannerEntity, RestoreEntity):
     """Representation of a tracked device."""
 
@@ -98,13 +93,20 @@ class AsusWrtMerlinDeviceTracker(ScannerEntity, RestoreEntity):
         """Initialize the device tracker."""
         self.coordinator = coordinator
         self._device = device
+        # Bound once: every property looks the device up by its MAC. Interned
+        # so lookups against the (interned) refresh data hit the identity fast path
+        self._mac = sys.intern(device[ATTR_MAC])
+        # Refreshed from the coordinator's classification on each update
+        self._attr_is_connected = self._mac in coordinator.home_macs
+        # What the last state write reflected, to skip no-op writes
+        self._written_snapshot: tuple[Any, ...] | None = None
         # Include hostname and MAC in the initial name (for entity_id generation),
         # but avoid duplicating the MAC if it's already present in the hostname.
         hostname = (device.get(ATTR_HOSTNAME) or "").strip()
         mac = device[ATTR_MAC]
         if hostname:
-            host_norm = hostname.lower().replace(":", "").replace("-", "")
-            mac_norm = mac.lower().replace(":", "").replace("-", "")
+            host_norm = hostname.lower().translate(_STRIP)
+            mac_norm = mac.lower().translate(_STRIP)
             if mac_norm in host_norm:
                 self._attr_name = hostname
             else:
@@ -128,29 +130,7 @@ class AsusWrtMerlinDeviceTracker(ScannerEntity, RestoreEntity):
     @property
     def is_connected(self) -> bool:
         """Return true if the device is connected to the network."""
-        if not self.coordinator.data:
-            return False
-
-        # Find the device in the current data
-        for device in self.coordinator.data:
-            if device[ATTR_MAC] == self._device[ATTR_MAC]:
-                # Check if device is currently connected (in ARP table)
-                if device.get("is_connected", False):
-                    return True
-
-                # Check if device was seen recently (only if last_seen exists)
-                last_seen = device.get(ATTR_LAST_SEEN)
-                if last_seen is not None:
-                    if isinstance(last_seen, str):
-                        last_seen = datetime.fromisoformat(last_seen)
-                    time_diff = datetime.now() - last_seen
-                    if time_diff.total_seconds() < self.coordinator.seconds_until_away:
-                        return True
-
-                # If last_seen is None, device is not connected
-                return False
-
-        return False
+        return self._attr_is_connected
 
     @property
     def state(self) -> str:
@@ -176,19 +156,15 @@ class AsusWrtMerlinDeviceTracker(ScannerEntity, RestoreEntity):
     @property
     def ip_address(self) -> str | None:
         """Return the IP address of the device."""
-        if not self.coordinator.data:
+        device = self.coordinator.data_by_mac.get(self._mac)
+        if device is None:
             return None
-
-        for device in self.coordinator.data:
-            if device[ATTR_MAC] == self._device[ATTR_MAC]:
-                return device.get(ATTR_IP)
-
-        return None
+        return device.get(ATTR_IP)
 
     @property
     def mac_address(self) -> str:
         """Return the MAC address of the device."""
-        return self._device[ATTR_MAC]
+        return self._mac
 
     @property
     def hostname(self) -> str:
@@ -199,23 +175,19 @@ class AsusWrtMerlinDeviceTracker(ScannerEntity, RestoreEntity):
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
         attrs = {
-            ATTR_MAC: self.mac_address,
+            ATTR_MAC: self._mac,
         }
 
-        if self.ip_address:
-            attrs[ATTR_IP] = self.ip_address
-
-        # Expose last_seen as ISO 8601 string when known
-        if self.coordinator.data:
-            for device in self.coordinator.data:
-                if device[ATTR_MAC] == self._device[ATTR_MAC]:
-                    last_seen = device.get(ATTR_LAST_SEEN)
-                    if isinstance(last_seen, datetime):
-                        attrs[ATTR_LAST_SEEN] = last_seen.isoformat()
-                    elif isinstance(last_seen, str):
-                        # Assume already in ISO format
-                        attrs[ATTR_LAST_SEEN] = last_seen
-                    break
+        # One lookup serves both the IP and last_seen
+        device = self.coordinator.data_by_mac.get(self._mac)
+        if device is not None:
+            ip = device.get(ATTR_IP)
+            if ip:
+                attrs[ATTR_IP] = ip
+            # Expose last_seen as ISO 8601 string when known
+            last_seen = device.get(ATTR_LAST_SEEN)
+            if last_seen is not None:
+                attrs[ATTR_LAST_SEEN] = last_seen.isoformat()
 
         return attrs
 
@@ -227,12 +199,7 @@ class AsusWrtMerlinDeviceTracker(ScannerEntity, RestoreEntity):
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information - link to main router device."""
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
-            "name": f"AsusWrt-Merlin router {self.coordinator.entry.data['host']}",
-            "manufacturer": "ASUS",
-            "model": "AsusWrt-Merlin router",
-        }
+        return self.coordinator.device_info
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -250,8 +217,31 @@ class AsusWrtMerlinDeviceTracker(ScannerEntity, RestoreEntity):
             self.entity_registry_enabled_default,
         )
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache the connection status from the coordinator and write state.
+
+        Most devices don't change between polls, so the write is skipped when
+        neither the status nor the IP changed. A connected device is seen
+        again on every poll, so its last_seen only counts while it is away;
+        while connected, the attribute shows the poll that last wrote state.
+        """
+        coordinator = self.coordinator
+        connected = self._mac in coordinator.home_macs
+        self._attr_is_connected = connected
+        device = coordinator.data_by_mac.get(self._mac)
+        snapshot = (
+            connected,
+            device and device.get(ATTR_IP),
+            None if connected else device and device.get(ATTR_LAST_SEEN),
         )
+        if snapshot == self._written_snapshot:
+            return
+        self._written_snapshot = snapshot
+        self.async_write_ha_state()
 
     async def async_update(self) -> None:
         """Update the entity.
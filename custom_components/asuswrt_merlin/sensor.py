@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -13,50 +12,15 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .coordinator import AsusWrtMerlinDataUpdateCoordinator
+from .const import BYTES_PER_GIB, DOMAIN, WAN_DIRECTIONS, WAN_PERIODS
+from .coordinator import AsusWrtMerlinDataUpdateCoordinator, AsusWrtMerlinWanCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-# Simple module-level WAN stats cache shared by all WAN sensors
-_WAN_CACHE: dict[str, Any] = {
-    "coordinator_ts": None,  # datetime of last coordinator update processed
-    "last_rx_bytes": None,
-    "last_tx_bytes": None,
-    "last_sample_ts": None,  # datetime of last WAN sample
-    "total_download_gb": None,
-    "total_upload_gb": None,
-    "download_mbps": None,
-    "upload_mbps": None,
-}
-
-
-def _ensure_wan_stats_updated(coordinator: AsusWrtMerlinDataUpdateCoordinator) -> None:
-    """Update WAN stats once per coordinator cycle using the coordinator's SSH client."""
-    try:
-        # Only refresh if we haven't processed this coordinator update yet
-        if _WAN_CACHE["coordinator_ts"] == coordinator.last_update_time:
-            return
-
-        _WAN_CACHE.update(
-            {
-                "coordinator_ts": coordinator.last_update_time,
-                "last_rx_bytes": None,
-                "last_tx_bytes": None,
-                "last_sample_ts": datetime.now(),
-                "total_download_gb": coordinator.wan_total_download_gb,
-                "total_upload_gb": coordinator.wan_total_upload_gb,
-                "download_mbps": coordinator.wan_download_mbps,
-                "upload_mbps": coordinator.wan_upload_mbps,
-            }
-        )
-    except Exception as ex:
-        _LOGGER.debug("WAN stats update failed: %s", ex)
-
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -64,20 +28,21 @@ async def async_setup_entry(
     """Set up sensor platform for AsusWrt-Merlin component."""
     # Get coordinator from hass data (created in __init__.py)
     coordinator = hass.data[DOMAIN][entry.entry_id]
+    # WAN sensors follow the faster WAN coordinator
+    wan_coordinator = coordinator.wan_coordinator
 
     entities = [
         AsusWrtMerlinRouterSensor(coordinator, entry),
-        AsusWrtMerlinWanTotalDownloadSensor(coordinator, entry),
-        AsusWrtMerlinWanTotalUploadSensor(coordinator, entry),
-        AsusWrtMerlinWanDownloadSpeedSensor(coordinator, entry),
-        AsusWrtMerlinWanUploadSpeedSensor(coordinator, entry),
-        AsusWrtMerlinWanDailyDownloadSensor(coordinator, entry),
-        AsusWrtMerlinWanDailyUploadSensor(coordinator, entry),
-        AsusWrtMerlinWanMonthlyDownloadSensor(coordinator, entry),
-        AsusWrtMerlinWanMonthlyUploadSensor(coordinator, entry),
-        AsusWrtMerlinWanYearlyDownloadSensor(coordinator, entry),
-        AsusWrtMerlinWanYearlyUploadSensor(coordinator, entry),
+        AsusWrtMerlinWanTotalDownloadSensor(wan_coordinator, entry),
+        AsusWrtMerlinWanTotalUploadSensor(wan_coordinator, entry),
+        AsusWrtMerlinWanDownloadSpeedSensor(wan_coordinator, entry),
+        AsusWrtMerlinWanUploadSpeedSensor(wan_coordinator, entry),
     ]
+    entities.extend(
+        _AccumulatingWanCounterSensor(wan_coordinator, entry, period, direction)
+        for period in WAN_PERIODS
+        for direction in WAN_DIRECTIONS
+    )
 
     async_add_entities(entities, True)
 
@@ -86,17 +51,15 @@ class AsusWrtMerlinSensorBase(CoordinatorEntity, SensorEntity):
     """Base class for AsusWrt-Merlin sensors."""
 
     def __init__(
-        self, coordinator: AsusWrtMerlinDataUpdateCoordinator, entry: ConfigEntry
+        self,
+        coordinator: AsusWrtMerlinDataUpdateCoordinator | AsusWrtMerlinWanCoordinator,
+        entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._entry = entry
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": f"AsusWrt-Merlin router {entry.data['host']}",
-            "manufacturer": "ASUS",
-            "model": "AsusWrt-Merlin router",
-        }
+        # Built once per entry by the coordinator and shared by all entities
+        self._attr_device_info = coordinator.device_info
 
 
 class AsusWrtMerlinRouterSensor(AsusWrtMerlinSensorBase):
@@ -111,106 +74,94 @@ class AsusWrtMerlinRouterSensor(AsusWrtMerlinSensorBase):
         self._attr_unique_id = f"{entry.entry_id}_router_info"
         self._attr_icon = "mdi:router-wireless"
         self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._static_attrs = {"host": entry.data["host"]}
+        # What the state was last set from, to skip no-op writes
+        self._last_digest: tuple[Any, ...] | None = None
+        self._update_from_coordinator()
 
-    @property
-    def native_value(self) -> int:
-        """Return the number of connected devices as the main value."""
-        if not self.coordinator.data:
-            return 0
-
-        # Count devices that are currently connected
-        connected_count = 0
-        for device in self.coordinator.data:
-            if device.get("is_connected", False):
-                connected_count += 1
-            else:
-                # Check if device was seen recently
-                last_seen = device.get("last_seen")
-                if last_seen is not None:
-                    if isinstance(last_seen, str):
-                        last_seen = datetime.fromisoformat(last_seen)
-                    time_diff = datetime.now() - last_seen
-                    if time_diff.total_seconds() < self.coordinator.seconds_until_away:
-                        connected_count += 1
-
-        return connected_count
+    async def async_added_to_hass(self) -> None:
+        """Pick up any refresh that happened between construction and adding."""
+        await super().async_added_to_hass()
+        self._update_from_coordinator()
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return comprehensive state attributes."""
-        attrs = {
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the value and attributes, writing state only on change.
+
+        On a stable network most polls change nothing but the last update
+        time, so those skip the state write altogether.
+        """
+        if self._update_from_coordinator():
+            super()._handle_coordinator_update()
+
+    def _update_from_coordinator(self) -> bool:
+        """Set the state value and attributes from the coordinator.
+
+        Returns False, leaving them untouched, when nothing but the last
+        update time changed since they were last set.
+        """
+        coordinator = self.coordinator
+        # Connected or seen recently, counted once per refresh by the coordinator
+        value = coordinator.recently_seen_count if coordinator.data else 0
+        # Device statistics, computed by the coordinator once per refresh
+        router_attrs = coordinator.router_attrs
+        digest = (
+            value,
+            coordinator.last_update_success,
+            coordinator.update_interval,
+            *router_attrs.values(),
+        )
+        if digest == self._last_digest:
+            return False
+        self._last_digest = digest
+        self._attr_native_value = value
+        last_update = coordinator.last_update_time
+        self._attr_extra_state_attributes = {
             # Router connection info
             "router_status": "Connected"
-            if self.coordinator.last_update_success
+            if coordinator.last_update_success
             else "Disconnected",
-            "host": self._entry.data["host"],
-            "update_interval_seconds": self.coordinator.update_interval.total_seconds(),
+            **self._static_attrs,
+            "update_interval_seconds": coordinator.update_interval.total_seconds(),
+            # Poll that last changed this sensor; unchanged polls skip the
+            # write, so this is not refreshed on every poll
+            "last_update": last_update.strftime("%Y-%m-%d %H:%M:%S")
+            if last_update
+            else None,
+            **router_attrs,
         }
+        return True
 
-        # Last update information
-        if self.coordinator.last_update_time:
-            attrs["last_update"] = self.coordinator.last_update_time.strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
-        else:
-            attrs["last_update"] = None
-
-        # Device statistics
-        if not self.coordinator.data:
-            attrs.update(
-                {
-                    "total_devices": 0,
-                    "active_devices": 0,
-                    "recently_seen_devices": 0,
-                    "offline_devices": 0,
-                    "devices": [],
-                }
-            )
-            return attrs
-
-        # Count devices by status
-        active_count = 0  # Currently in ARP table (actively communicating)
-        recently_seen_count = 0  # Not in ARP but seen within seconds_until_away time
-        offline_count = 0
-
-        for device in self.coordinator.data:
-            is_connected = device.get("is_connected", False)
-
-            if is_connected:
-                # Device is actively communicating (in ARP table)
-                active_count += 1
-                recently_seen_count += 1
-            else:
-                # Check if device was seen recently but not currently active
-                last_seen = device.get("last_seen")
-                if last_seen is not None:
-                    if isinstance(last_seen, str):
-                        last_seen = datetime.fromisoformat(last_seen)
-                    time_diff = datetime.now() - last_seen
-                    if time_diff.total_seconds() < self.coordinator.seconds_until_away:
-                        recently_seen_count += 1
-                    else:
-                        offline_count += 1
-                else:
-                    offline_count += 1
-
-        attrs.update(
-            {
-                "total_devices": len(self.coordinator.data),
-                "active_devices": active_count,
-                "recently_seen_devices": recently_seen_count,
-                "offline_devices": offline_count,
-            }
-        )
 
-        return attrs
+class _WanCoordinatorValueSensor(AsusWrtMerlinSensorBase):
+    """Base for WAN sensors mirroring a value computed by the WAN coordinator."""
+
+    _coordinator_attr: str  # name of the AsusWrtMerlinWanCoordinator attribute
+
+    def __init__(
+        self, coordinator: AsusWrtMerlinWanCoordinator, entry: ConfigEntry
+    ) -> None:
+        super().__init__(coordinator, entry)
+        self._update_from_coordinator()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache the coordinator's value once per update and write state."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
 
+    def _update_from_coordinator(self) -> None:
+        value = getattr(self.coordinator, self._coordinator_attr)
+        self._attr_native_value = round(value, 3) if value is not None else None
 
-class AsusWrtMerlinWanTotalDownloadSensor(AsusWrtMerlinSensorBase):
+
+class AsusWrtMerlinWanTotalDownloadSensor(_WanCoordinatorValueSensor):
     """Sensor for total WAN download in GB."""
 
+    _coordinator_attr = "wan_total_download_gb"
+
     def __init__(
-        self, coordinator: AsusWrtMerlinDataUpdateCoordinator, entry: ConfigEntry
+        self, coordinator: AsusWrtMerlinWanCoordinator, entry: ConfigEntry
     ) -> None:
         super().__init__(coordinator, entry)
         self._attr_name = "WAN total downloaded"
@@ -220,20 +171,14 @@ class AsusWrtMerlinWanTotalDownloadSensor(AsusWrtMerlinSensorBase):
         self._attr_device_class = SensorDeviceClass.DATA_SIZE
         self._attr_state_class = SensorStateClass.TOTAL_INCREASING
 
-    @property
-    def native_value(self) -> float | None:
-        _ensure_wan_stats_updated(self.coordinator)
-        value = _WAN_CACHE.get("total_download_gb")
-        if value is None:
-            return None
-        return round(value, 3)
-
 
-class AsusWrtMerlinWanTotalUploadSensor(AsusWrtMerlinSensorBase):
+class AsusWrtMerlinWanTotalUploadSensor(_WanCoordinatorValueSensor):
     """Sensor for total WAN upload in GB."""
 
+    _coordinator_attr = "wan_total_upload_gb"
+
     def __init__(
-        self, coordinator: AsusWrtMerlinDataUpdateCoordinator, entry: ConfigEntry
+        self, coordinator: AsusWrtMerlinWanCoordinator, entry: ConfigEntry
     ) -> None:
         super().__init__(coordinator, entry)
         self._attr_name = "WAN total uploaded"
@@ -243,20 +188,14 @@ class AsusWrtMerlinWanTotalUploadSensor(AsusWrtMerlinSensorBase):
         self._attr_device_class = SensorDeviceClass.DATA_SIZE
         self._attr_state_class = SensorStateClass.TOTAL_INCREASING
 
-    @property
-    def native_value(self) -> float | None:
-        _ensure_wan_stats_updated(self.coordinator)
-        value = _WAN_CACHE.get("total_upload_gb")
-        if value is None:
-            return None
-        return round(value, 3)
-
 
-class AsusWrtMerlinWanDownloadSpeedSensor(AsusWrtMerlinSensorBase):
+class AsusWrtMerlinWanDownloadSpeedSensor(_WanCoordinatorValueSensor):
     """Sensor for current WAN download speed in Mbps."""
 
+    _coordinator_attr = "wan_download_mbps"
+
     def __init__(
-        self, coordinator: AsusWrtMerlinDataUpdateCoordinator, entry: ConfigEntry
+        self, coordinator: AsusWrtMerlinWanCoordinator, entry: ConfigEntry
     ) -> None:
         super().__init__(coordinator, entry)
         self._attr_name = "WAN download speed"
@@ -264,20 +203,14 @@ class AsusWrtMerlinWanDownloadSpeedSensor(AsusWrtMerlinSensorBase):
         self._attr_icon = "mdi:download-network"
         self._attr_native_unit_of_measurement = "Mbit/s"
 
-    @property
-    def native_value(self) -> float | None:
-        _ensure_wan_stats_updated(self.coordinator)
-        value = _WAN_CACHE.get("download_mbps")
-        if value is None:
-            return None
-        return round(value, 3)
 
-
-class AsusWrtMerlinWanUploadSpeedSensor(AsusWrtMerlinSensorBase):
+class AsusWrtMerlinWanUploadSpeedSensor(_WanCoordinatorValueSensor):
     """Sensor for current WAN upload speed in Mbps."""
 
+    _coordinator_attr = "wan_upload_mbps"
+
     def __init__(
-        self, coordinator: AsusWrtMerlinDataUpdateCoordinator, entry: ConfigEntry
+        self, coordinator: AsusWrtMerlinWanCoordinator, entry: ConfigEntry
     ) -> None:
         super().__init__(coordinator, entry)
         self._attr_name = "WAN upload speed"
@@ -285,154 +218,68 @@ class AsusWrtMerlinWanUploadSpeedSensor(AsusWrtMerlinSensorBase):
         self._attr_icon = "mdi:upload-network"
         self._attr_native_unit_of_measurement = "Mbit/s"
 
-    @property
-    def native_value(self) -> float | None:
-        _ensure_wan_stats_updated(self.coordinator)
-        value = _WAN_CACHE.get("upload_mbps")
-        if value is None:
-            return None
-        return round(value, 3)
-
 
 class _AccumulatingWanCounterSensor(AsusWrtMerlinSensorBase, RestoreEntity):
-    """Base for daily/monthly accumulating WAN counters that persist restarts."""
-
-    _period: str  # "daily" or "monthly"
-    _direction: str  # "download" or "upload"
+    """Daily/monthly/yearly WAN traffic total kept by the coordinator."""
 
     def __init__(
-        self, coordinator: AsusWrtMerlinDataUpdateCoordinator, entry: ConfigEntry
+        self,
+        coordinator: AsusWrtMerlinWanCoordinator,
+        entry: ConfigEntry,
+        period: str,
+        direction: str,
     ) -> None:
         super().__init__(coordinator, entry)
-        self._value_gb: float | None = None
-        self._last_period_marker: str | None = None
+        self._period = period  # "daily", "monthly" or "yearly"
+        self._direction = direction  # "download" or "upload"
+        self._key = f"{period}_{direction}"
+        verb = "downloaded" if direction == "download" else "uploaded"
+        self._attr_name = f"WAN {period} {verb}"
+        self._attr_unique_id = f"{entry.entry_id}_wan_{period}_{direction}_gb"
+        self._attr_icon = f"mdi:{direction}"
         self._attr_native_unit_of_measurement = "GB"
         self._attr_device_class = SensorDeviceClass.DATA_SIZE
         self._attr_state_class = SensorStateClass.TOTAL_INCREASING
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
-        last_state = await self.async_get_last_state()
-        if last_state and last_state.state not in (None, "unknown", "unavailable"):
-            try:
-                self._value_gb = float(last_state.state)
-            except (TypeError, ValueError):
-                self._value_gb = 0.0
-        else:
-            self._value_gb = 0.0
-
-        # Restore last period marker
-        if last_state and last_state.attributes:
-            self._last_period_marker = last_state.attributes.get("period_marker")
-
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self._handle_coordinator_update)
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        return round(self._value_gb, 3) if self._value_gb is not None else None
+        accumulators = self.coordinator.accumulators
+        # Totals are persisted by the coordinator; the last sensor state is
+        # only read to migrate a total that was never stored there
+        if not accumulators.has_stored(self._period, self._direction):
+            last_state = await self.async_get_last_state()
+            if last_state and last_state.state not in (
+                None,
+                "unknown",
+                "unavailable",
+            ):
+                try:
+                    value_bytes = round(float(last_state.state) * BYTES_PER_GIB)
+                except (TypeError, ValueError):
+                    value_bytes = 0
+                accumulators.async_seed(
+                    self._period,
+                    self._direction,
+                    value_bytes,
+                    last_state.attributes.get("period_marker"),
+                )
+        self._update_from_coordinator()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         return {
             "period": self._period,
             "direction": self._direction,
-            "period_marker": self._current_period_marker(),
+            "period_marker": self.coordinator.accumulators.markers.get(self._period),
         }
 
-    def _current_period_marker(self) -> str:
-        now = datetime.now()
-        if self._period == "daily":
-            return now.strftime("%Y-%m-%d")
-        if self._period == "monthly":
-            return now.strftime("%Y-%m")
-        # yearly
-        return now.strftime("%Y")
-
-    def _maybe_reset_for_new_period(self) -> None:
-        marker = self._current_period_marker()
-        if self._last_period_marker != marker:
-            self._value_gb = 0.0
-            self._last_period_marker = marker
+    def _update_from_coordinator(self) -> None:
+        """Refresh the GB value from the coordinator's byte total."""
+        total = self.coordinator.accumulators.totals.get(self._key, 0)
+        self._attr_native_value = round(total / BYTES_PER_GIB, 3)
 
+    @callback
     def _handle_coordinator_update(self) -> None:
-        try:
-            # Reset if new day/month started
-            self._maybe_reset_for_new_period()
-
-            # Add latest delta
-            if self._direction == "download":
-                delta_bytes = self.coordinator.wan_last_rx_delta_bytes or 0
-            else:
-                delta_bytes = self.coordinator.wan_last_tx_delta_bytes or 0
-
-            self._value_gb = (self._value_gb or 0.0) + (delta_bytes / (1024**3))
-        finally:
-            self.async_write_ha_state()
-
-
-class AsusWrtMerlinWanDailyDownloadSensor(_AccumulatingWanCounterSensor):
-    _period = "daily"
-    _direction = "download"
-
-    def __init__(self, coordinator, entry) -> None:
-        super().__init__(coordinator, entry)
-        self._attr_name = "WAN daily downloaded"
-        self._attr_unique_id = f"{entry.entry_id}_wan_daily_download_gb"
-        self._attr_icon = "mdi:download"
-
-
-class AsusWrtMerlinWanDailyUploadSensor(_AccumulatingWanCounterSensor):
-    _period = "daily"
-    _direction = "upload"
-
-    def __init__(self, coordinator, entry) -> None:
-        super().__init__(coordinator, entry)
-        self._attr_name = "WAN daily uploaded"
-        self._attr_unique_id = f"{entry.entry_id}_wan_daily_upload_gb"
-        self._attr_icon = "mdi:upload"
-
-
-class AsusWrtMerlinWanMonthlyDownloadSensor(_AccumulatingWanCounterSensor):
-    _period = "monthly"
-    _direction = "download"
-
-    def __init__(self, coordinator, entry) -> None:
-        super().__init__(coordinator, entry)
-        self._attr_name = "WAN monthly downloaded"
-        self._attr_unique_id = f"{entry.entry_id}_wan_monthly_download_gb"
-        self._attr_icon = "mdi:download"
-
-
-class AsusWrtMerlinWanMonthlyUploadSensor(_AccumulatingWanCounterSensor):
-    _period = "monthly"
-    _direction = "upload"
-
-    def __init__(self, coordinator, entry) -> None:
-        super().__init__(coordinator, entry)
-        self._attr_name = "WAN monthly uploaded"
-        self._attr_unique_id = f"{entry.entry_id}_wan_monthly_upload_gb"
-        self._attr_icon = "mdi:upload"
-
-
-class AsusWrtMerlinWanYearlyDownloadSensor(_AccumulatingWanCounterSensor):
-    _period = "yearly"
-    _direction = "download"
-
-    def __init__(self, coordinator, entry) -> None:
-        super().__init__(coordinator, entry)
-        self._attr_name = "WAN yearly downloaded"
-        self._attr_unique_id = f"{entry.entry_id}_wan_yearly_download_gb"
-        self._attr_icon = "mdi:download"
-
-
-class AsusWrtMerlinWanYearlyUploadSensor(_AccumulatingWanCounterSensor):
-    _period = "yearly"
-    _direction = "upload"
-
-    def __init__(self, coordinator, entry) -> None:
-        super().__init__(coordinator, entry)
-        self._attr_name = "WAN yearly uploaded"
-        self._attr_unique_id = f"{entry.entry_id}_wan_yearly_upload_gb"
-        self._attr_icon = "mdi:upload"
+        """Refresh the value, then let CoordinatorEntity write state once."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
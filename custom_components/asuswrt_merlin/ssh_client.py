@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import logging
+import re
+import sys
 from datetime import datetime
 from typing import Any
 
 import paramiko
 
 from .const import (
+    ATTR_IS_CONNECTED,
     ATTR_HOSTNAME,
     ATTR_IP,
     ATTR_LAST_SEEN,
@@ -17,10 +20,24 @@ from .const import (
     CMD_DEVICES,
     CMD_WAN_IFNAME,
     CMD_PROC_NET_DEV,
+    DEFAULT_SSH_KEEPALIVE,
+    SECTION_MARKER,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_MARKER_BYTES = SECTION_MARKER.encode()
+
+# dnsmasq lease line: expiry mac ip hostname [client_id]; both patterns run
+# on the raw command output, so only the captured fields get decoded
+_DHCP_LEASE_RE = re.compile(
+    rb"^[ \t]*\S+[ \t]+(\S+)[ \t]+(\S+)[ \t]+(\S+)", re.MULTILINE
+)
+# /proc/net/arp line: ip hw_type flags mac mask device; flags 0x2 means reachable
+_ARP_ENTRY_RE = re.compile(
+    rb"^[ \t]*(\S+)[ \t]+\S+[ \t]+0x2[ \t]+(\S+)[ \t]+\S+[ \t]+\S+", re.MULTILINE
+)
+
 
 class AsusWrtSSHClient:
     """SSH client for AsusWrt-Merlin router."""
@@ -48,6 +65,7 @@ class AsusWrtSSHClient:
         self.password = password
         self.ssh_key = ssh_key  # This should be a file path
         self.client: paramiko.SSHClient | None = None
+        # WAN interface name, cached for the lifetime of the SSH session
         self._wan_iface_cache: str | None = None
 
     def connect(self) -> None:
@@ -82,11 +100,33 @@ class AsusWrtSSHClient:
                 f"Failed to connect to {self.host}:{self.port}"
             ) from ex
 
+        # Keep the session alive between polls so NAT/firewalls don't drop it
+        transport = self.client.get_transport()
+        if transport:
+            transport.set_keepalive(DEFAULT_SSH_KEEPALIVE)
+
     def disconnect(self) -> None:
         """Disconnect from the router."""
         if self.client:
             self.client.close()
             self.client = None
+        # The WAN interface may change while we're away (e.g. dual WAN failover)
+        self._wan_iface_cache = None
+
+    @property
+    def is_connected(self) -> bool:
+        """Return True if the SSH transport is still alive."""
+        if not self.client:
+            return False
+        transport = self.client.get_transport()
+        return bool(transport and transport.is_active())
+
+    def ensure_connected(self) -> None:
+        """Connect to the router unless the current session is still alive."""
+        if self.is_connected:
+            return
+        self.disconnect()
+        self.connect()
 
     def _load_ssh_key(self, key_path: str) -> paramiko.PKey:
         """Load SSH private key from file, supporting multiple key types."""
@@ -118,186 +158,204 @@ class AsusWrtSSHClient:
                 f"Failed to load SSH key from {key_path}: {ex}"
             ) from ex
 
-    def _execute_command(self, command: str) -> str:
-        """Execute a command on the router."""
+    def _execute_command_raw(self, command: str) -> bytes:
+        """Execute a command on the router and return its raw output.
+
+        If the persistent session has gone stale, reconnect once and retry.
+        """
         if not self.client:
             raise ConnectionError("Not connected to router")
 
         try:
-            stdin, stdout, stderr = self.client.exec_command(command)
-            output = stdout.read().decode("utf-8")
-            error = stderr.read().decode("utf-8")
-
-            if error:
-                _LOGGER.warning("Command error: %s", error)
+            try:
+                stdin, stdout, stderr = self.client.exec_command(command)
+            except (paramiko.SSHException, EOFError, OSError):
+                _LOGGER.debug("SSH session lost, reconnecting to %s", self.host)
+                self.disconnect()
+                self.connect()
+                stdin, stdout, stderr = self.client.exec_command(command)
+            output = stdout.read()
+            # stdout hitting EOF means any stderr is already buffered, so only
+            # drain and decode it when there is some; usually there is none
+            if stdout.channel.recv_stderr_ready():
+                error = stderr.read().decode("utf-8", "replace")
+                if error:
+                    _LOGGER.warning("Command error: %s", error)
 
             return output
         except Exception as ex:
             raise RuntimeError(f"Failed to execute command: {command}") from ex
 
-    def ping_ips(self, ips: list[str]) -> None:
-        """Best-effort: ping a list of IPs in parallel on the router to refresh ARP.
-
-        Uses: ping -c1 -w1 -s32 for each IP, runs them in background and waits.
-        Any errors are ignored.
+    def _build_ping_command(self, ips: list[str]) -> str | None:
+        """Build a shell snippet pinging IPs in parallel with a 1s deadline."""
+        # IPs are expected to be plain numeric strings (safe to inject)
+        joined = " ".join(ip for ip in ips if ip)
+        if not joined:
+            return None
+        return (
+            "sh -c 'for ip in "
+            + joined
+            + '; do ping -c1 -w1 -s32 "$ip" >/dev/null 2>&1 & done; wait\''
+        )
+
+    def _run_batch(
+        self, commands: list[str], trailer: str | None = None
+    ) -> list[bytes]:
+        """Run commands in one exec_command round-trip and split their outputs.
+
+        Each command's output is followed by a marker line. An optional
+        trailer runs last and its output is ignored. Sections are returned
+        undecoded so callers only decode what they need as text.
         """
-        try:
-            if not ips:
-                return
-            # Build a small shell to ping all IPs in parallel with 1s deadline
-            # IPs are expected to be plain numeric strings (safe to inject)
-            joined = " ".join(ip for ip in ips if ip)
-            if not joined:
-                return
-            cmd = (
-                "sh -c 'for ip in "
-                + joined
-                + '; do ping -c1 -w1 -s32 "$ip" >/dev/null 2>&1 & done; wait\''
-            )
-            self._execute_command(cmd)
-        except Exception:
-            # Non-fatal; continue regardless of ping outcome
-            pass
+        script = "; ".join(f"{cmd}; echo '{SECTION_MARKER}'" for cmd in commands)
+        if trailer:
+            script = f"{script}; {trailer}"
+
+        output = self._execute_command_raw(script)
+        sections = [section.strip(b"\n") for section in output.split(_MARKER_BYTES)]
+        # N markers split complete output into N + 1 sections (the last holds
+        # any trailer output); fewer means the output was cut short
+        if len(sections) <= len(commands):
+            raise RuntimeError("Unexpected output from batched router query")
+        return sections
+
+    def get_all(
+        self, ping_ips: list[str] | None = None
+    ) -> tuple[list[dict[str, Any]], dict[str, int] | None]:
+        """Fetch devices and WAN counters with a single exec_command round-trip.
+
+        Reads DHCP leases, the ARP table and the WAN counters (plus the WAN
+        interface until cached); if ping_ips is given, the pings run at the
+        end of the same command to refresh the router's ARP table for the
+        next poll.
+        """
+        iface = self._wan_iface_cache
+        commands = [CMD_DEVICES, CMD_ARP, CMD_PROC_NET_DEV]
+        if not iface:
+            commands.append(CMD_WAN_IFNAME)
+        ping_cmd = self._build_ping_command(ping_ips) if ping_ips else None
+        sections = self._run_batch(commands, ping_cmd)
+        if not iface:
+            iface = self._parse_wan_interface(sections[3].decode("utf-8"))
+        self._wan_iface_cache = iface
 
-    def get_wan_interface(self) -> str:
-        """Get WAN interface name from nvram, with simple cache."""
-        if self._wan_iface_cache:
-            return self._wan_iface_cache
+        devices = self._merge_devices(
+            self._parse_dhcp_leases(sections[0]),
+            self._parse_arp_table(sections[1]),
+        )
+        return devices, self._parse_wan_counters(sections[2], iface)
 
-        output = self._execute_command(CMD_WAN_IFNAME).strip()
+    def _parse_wan_interface(self, output: str) -> str:
+        """Parse the WAN interface name from nvram output."""
+        output = output.strip()
         iface = output.splitlines()[0].strip() if output else ""
         if not iface:
             # Fallback to common defaults
             iface = "eth4"
-        self._wan_iface_cache = iface
         return iface
 
     def get_wan_counters(self) -> dict[str, int] | None:
         """Return WAN RX/TX byte counters from /proc/net/dev for the WAN iface.
 
+        The WAN interface lookup (until cached) shares the same exec_command.
         Returns a dict: {"rx_bytes": int, "tx_bytes": int} or None on failure.
         """
-        iface = self.get_wan_interface()
-        output = self._execute_command(CMD_PROC_NET_DEV)
+        # Snapshot the cache: a reconnect during the command clears it
+        iface = self._wan_iface_cache
+        commands = [CMD_PROC_NET_DEV]
+        if not iface:
+            commands.append(CMD_WAN_IFNAME)
+        sections = self._run_batch(commands)
+        if not iface:
+            iface = self._parse_wan_interface(sections[1].decode("utf-8"))
+        self._wan_iface_cache = iface
+        return self._parse_wan_counters(sections[0], iface)
+
+    def _parse_wan_counters(self, output: bytes, iface: str) -> dict[str, int] | None:
+        """Parse WAN RX/TX byte counters for iface from raw /proc/net/dev output.
+
+        Works on bytes: only two integers are needed, so the file is never
+        decoded as a whole.
+        """
         if not output:
             return None
 
         # /proc/net/dev format lines like: "  eth0: bytes    packets ... | bytes packets ..."
-        lines = output.strip().split("\n")
-        for line in lines:
-            if ":" not in line:
-                continue
-            left, right = line.split(":", 1)
-            name = left.strip()
-            if name != iface:
+        # Large counters may abut the colon ("eth0:123..."), so match on "iface:"
+        prefix = f"{iface}:".encode()
+        for line in output.splitlines():
+            line = line.lstrip()
+            if not line.startswith(prefix):
                 continue
             # After colon: receive fields then transmit fields
-            parts = right.split()
+            parts = line[len(prefix) :].split()
             if len(parts) < 16:
-                continue
+                return None
             try:
-                rx_bytes = int(parts[0])
-                tx_bytes = int(parts[8])
-                return {"rx_bytes": rx_bytes, "tx_bytes": tx_bytes}
+                return {"rx_bytes": int(parts[0]), "tx_bytes": int(parts[8])}
             except ValueError:
-                continue
+                return None
         return None
 
-    def get_connected_devices(self) -> list[dict[str, Any]]:
-        """Get list of connected devices from the router."""
+    def _merge_devices(
+        self,
+        leases: list[tuple[str, str, str]],
+        arp_macs: set[str],
+    ) -> list[dict[str, Any]]:
+        """Merge DHCP leases with the ARP table's MACs into device records."""
         devices = []
+        # One timestamp for the whole poll
+        now = datetime.now()
 
-        try:
-            # Get DHCP leases
-            dhcp_output = self._execute_command(CMD_DEVICES)
-            dhcp_devices = self._parse_dhcp_leases(dhcp_output)
-
-            # Get ARP table
-            arp_output = self._execute_command(CMD_ARP)
-            arp_devices = self._parse_arp_table(arp_output)
-
-            # Merge DHCP and ARP data
-            for dhcp_device in dhcp_devices:
-                mac = dhcp_device[ATTR_MAC].upper()
+        for mac, ip, hostname in leases:
+            # Interned so every poll's records and the coordinator's maps share
+            # one string per MAC instead of accumulating fresh copies
+            mac = sys.intern(mac)
 
-                # Check if device is in ARP table (active)
-                is_connected = any(
-                    arp_device[ATTR_MAC].upper() == mac for arp_device in arp_devices
-                )
+            # Check if device is in ARP table (active)
+            is_connected = mac in arp_macs
 
-                device = {
+            devices.append(
+                {
                     ATTR_MAC: mac,
-                    ATTR_HOSTNAME: dhcp_device[ATTR_HOSTNAME],
-                    ATTR_IP: dhcp_device[ATTR_IP],
-                    "is_connected": is_connected,
+                    ATTR_HOSTNAME: hostname,
+                    ATTR_IP: ip,
+                    ATTR_IS_CONNECTED: is_connected,
+                    # Only connected devices (in the ARP table) are seen now; the
+                    # coordinator backfills the rest from its mac_last_seen map
+                    ATTR_LAST_SEEN: now if is_connected else None,
                 }
+            )
 
-                # Only update last_seen for devices that are actually connected (in ARP table)
-                if is_connected:
-                    device[ATTR_LAST_SEEN] = datetime.now()
-                else:
-                    # For devices not in ARP table, we don't set last_seen here
-                    # The coordinator will backfill the last_seen using its mac_last_seen map
-                    device[ATTR_LAST_SEEN] = None
-
-                devices.append(device)
-
+        # Counting connected devices is a full pass, so only do it for debug logs
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Found %d devices", len(devices))
             connected_count = sum(
-                1 for device in devices if device.get("is_connected", False)
+                1 for device in devices if device.get(ATTR_IS_CONNECTED, False)
             )
             _LOGGER.debug("Found %d connected devices (in ARP table)", connected_count)
-            return devices
-
-        except Exception as ex:
-            _LOGGER.error("Failed to get connected devices: %s", ex)
-            return []
-
-    def _parse_dhcp_leases(self, output: str) -> list[dict[str, str]]:
-        """Parse DHCP leases output."""
-        devices = []
-        lines = output.strip().split("\n")
-
-        for line in lines:
-            if not line.strip():
-                continue
-
-            # Format: timestamp mac ip hostname client_id
-            parts = line.split()
-            if len(parts) >= 4:
-                hostname = parts[3]
-                # Use MAC address with underscores if hostname is empty, "*", or just whitespace
-                if not hostname or hostname == "*" or not hostname.strip():
-                    hostname = f"device_{parts[1].replace(':', '-')}"
-
-                devices.append(
-                    {
-                        ATTR_MAC: parts[1],
-                        ATTR_IP: parts[2],
-                        ATTR_HOSTNAME: hostname,
-                    }
-                )
-
         return devices
 
-    def _parse_arp_table(self, output: str) -> list[dict[str, str]]:
-        """Parse ARP table output."""
-        devices = []
-        lines = output.strip().split("\n")
-
-        for line in lines:
-            if not line.strip() or line.startswith("IP address"):
-                continue
+    def _parse_dhcp_leases(self, output: bytes) -> list[tuple[str, str, str]]:
+        """Parse raw DHCP leases output into (MAC, IP, hostname) tuples."""
+        leases = []
+        for raw_mac, raw_ip, raw_hostname in _DHCP_LEASE_RE.findall(output):
+            mac = raw_mac.decode("ascii", "replace")
+            # Use MAC address with underscores if hostname is "*"
+            if raw_hostname == b"*":
+                hostname = f"device_{mac.replace(':', '-')}"
+            else:
+                hostname = raw_hostname.decode("utf-8", "replace")
+            leases.append((mac.upper(), raw_ip.decode("ascii", "replace"), hostname))
+        return leases
 
-            # Format: IP address HW type Flags HW address Mask Device
-            parts = line.split()
-            if len(parts) >= 6 and parts[2] == "0x2":  # 0x2 means reachable
-                devices.append(
-                    {
-                        ATTR_IP: parts[0],
-                        ATTR_MAC: parts[3],
-                        ATTR_HOSTNAME: f"device_{parts[3].replace(':', '-')}",
-                    }
-                )
+    def _parse_arp_table(self, output: bytes) -> set[str]:
+        """Return the MACs of the raw ARP table's entries.
 
-        return devices
+        Only complete (reachable) entries match; the header never does.
+        Merging only tests membership, so no per-entry records are built.
+        """
+        return {
+            raw_mac.decode("ascii", "replace").upper()
+            for _, raw_mac in _ARP_ENTRY_RE.findall(output)
+        }